@@ -188,3 +188,31 @@ class TestFriend:
             == "Please react to this message with a thumbs up"
         )
         assert social_media.react.call_args[0][1].author == "Bob#0000"
+
+    async def test__call__lists_tools_once(self, mocker, social_media):
+        tool_call = Mock(id="call_1")
+        tool_call.function.name = "list_servers"
+        tool_call.function.arguments = "{}"
+        acompletion = mocker.patch("vercade.agent.acompletion")
+        acompletion.side_effect = lambda **kwargs: Mock(
+            choices=[
+                Mock(
+                    message=Mock(
+                        content="",
+                        tool_calls=[tool_call]
+                        if kwargs["messages"][-1]["role"] == "user"
+                        else None,
+                    )
+                )
+            ]
+        )
+        mcp_client = LocalDiscordMcp(social_media, bot_name="Proctor")
+        mcp_client.list_tools = AsyncMock(wraps=mcp_client.list_tools)
+        friend = Agent(
+            name="Proctor",
+            identity="You are Proctor, a sentient and intelligent Discord chatbot.",
+            mcp_client=mcp_client,
+        )
+        await friend("You are currently idle.")
+        await friend("You are currently idle.")
+        mcp_client.list_tools.assert_awaited_once()
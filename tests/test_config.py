@@ -0,0 +1,69 @@
+import pytest
+
+from vercade.config import Config
+
+
+@pytest.fixture(autouse=True)
+def env(mocker, monkeypatch):
+    mocker.patch("vercade.config.dotenv.load_dotenv")
+    monkeypatch.setenv("VERCADE_NAME", "Proctor")
+    monkeypatch.setenv("VERCADE_IDENTITY", "You are Proctor.")
+    monkeypatch.setenv("DISCORD_TOKEN", "token")
+    monkeypatch.setenv("VERCADE_LLM", "gpt-5.5")
+    monkeypatch.delenv("VERCADE_SCHEDULE_INTERVAL", raising=False)
+    monkeypatch.delenv("VERCADE_LLM_TEMPERATURE", raising=False)
+    return monkeypatch
+
+
+class TestConfig:
+    def test_from_env_reads_required_values(self):
+        config = Config.from_env()
+        assert config.name == "Proctor"
+        assert config.identity == "You are Proctor."
+        assert config.discord_token == "token"
+        assert config.llm == "gpt-5.5"
+        assert config.temperature is None
+        assert config.schedule_interval_seconds is None
+
+    def test_from_env_with_missing_values_lists_all_of_them(self, env):
+        env.delenv("VERCADE_NAME")
+        env.setenv("DISCORD_TOKEN", "")
+        with pytest.raises(ValueError, match="VERCADE_NAME, DISCORD_TOKEN"):
+            Config.from_env()
+
+    def test_from_env_parses_temperature(self, env):
+        env.setenv("VERCADE_LLM_TEMPERATURE", "0.5")
+        assert Config.from_env().temperature == 0.5
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("", None),
+            ("disabled", None),
+            (" Disabled ", None),
+            ("300", 300.0),
+            ("1.5", 1.5),
+            ("45s", 45.0),
+            ("15m", 900.0),
+            ("2h", 7200.0),
+            ("1.5H", 5400.0),
+        ],
+    )
+    def test_from_env_parses_schedule_interval(self, env, value, expected):
+        env.setenv("VERCADE_SCHEDULE_INTERVAL", value)
+        assert Config.from_env().schedule_interval_seconds == expected
+
+    @pytest.mark.parametrize("value", ["soon", "15d", "m"])
+    def test_from_env_with_invalid_schedule_interval_raises(self, env, value):
+        env.setenv("VERCADE_SCHEDULE_INTERVAL", value)
+        with pytest.raises(ValueError, match="VERCADE_SCHEDULE_INTERVAL"):
+            Config.from_env()
+
+    def test_from_env_normalizes_log_level(self, env):
+        env.setenv("VERCADE_LOG_LEVEL", "debug")
+        assert Config.from_env().log_level == "DEBUG"
+
+    def test_from_env_with_invalid_log_level_raises(self, env):
+        env.setenv("VERCADE_LOG_LEVEL", "verbose")
+        with pytest.raises(ValueError, match="VERCADE_LOG_LEVEL"):
+            Config.from_env()
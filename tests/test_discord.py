@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from vercade.discord import DiscordClient
+from vercade.social_media import Message
+
+
+def _member(id: int, name: str) -> Mock:
+    member = Mock(id=id)
+    member.name = name
+    return member
+
+
+@pytest.fixture
+def channel():
+    guild = Mock(id=1, members=[_member(10, "bob"), _member(11, "bobby")])
+    return Mock(guild=guild)
+
+
+@pytest.fixture
+def client():
+    return DiscordClient(friend=Mock())
+
+
+def _message(content: str) -> Message:
+    return Message(
+        content=content, author="Proctor", created_at=datetime.now(tz=timezone.utc)
+    )
+
+
+class TestDiscordClient:
+    def test_format_message_for_discord_replaces_mentions(self, client, channel):
+        assert (
+            client._format_message_for_discord(_message("Hi @bob and @bobby"), channel)
+            == "Hi <@10> and <@11>"
+        )
+
+    def test_format_message_for_discord_keeps_unknown_mentions(
+        self, client, channel, caplog
+    ):
+        assert (
+            client._format_message_for_discord(_message("Hi @alice"), channel)
+            == "Hi @alice"
+        )
+        assert "User alice not found" in caplog.text
+
+    def test_format_message_for_discord_sees_replaced_members(self, client, channel):
+        client._format_message_for_discord(_message("Hi @bob"), channel)
+        channel.guild.members[:] = [_member(12, "carol"), _member(11, "bobby")]
+        assert (
+            client._format_message_for_discord(_message("Hi @carol and @bob"), channel)
+            == "Hi <@12> and @bob"
+        )
+
+    def test_format_message_for_discord_sees_renamed_members(self, client, channel):
+        client._format_message_for_discord(_message("Hi @bob"), channel)
+        channel.guild.members[0].name = "robert"
+        assert (
+            client._format_message_for_discord(_message("Hi @robert and @bob"), channel)
+            == "Hi <@10> and @bob"
+        )
+
+    async def test_discord_message_to_message_replaces_mentions(self, client):
+        bob = _member(10, "bob")
+        bob.mention = "<@10>"
+        bobby = _member(11, "bobby")
+        bobby.mention = "<@11>"
+        discord_message = Mock(
+            system_content="Hi <@10>, <@11> and <@10>",
+            mentions=[bob, bobby],
+            reactions=[],
+            embeds=[],
+            created_at=datetime.now(tz=timezone.utc),
+        )
+        message = await client._discord_message_to_message(discord_message)
+        assert message.content == "Hi @bob, @bobby and @bob"
@@ -1,121 +1,71 @@
 import asyncio
 import json
-import logging
 import os
 import re
-from pathlib import Path
+from typing import Any
 
-import dotenv
+import discord
 import fastmcp
-import nest_asyncio
-from discord import CustomActivity
 
 from vercade.agent import Agent
+from vercade.config import Config, configure_logging
 from vercade.discord import DiscordClient
 from vercade.trigger import Trigger
 
+_ENV_REFERENCE_REGEX = re.compile(r"\A\$([A-Za-z_][A-Za-z0-9_]*)\Z")
 
-# TODO(#22): Move outside of __init__.py
-def _parse_schedule_interval_seconds(value: str | None) -> float | None:
-    """
-    Parse VERCADE_SCHEDULE_INTERVAL into seconds.
 
-    Supports raw seconds (e.g. "300"), or suffixed values like "15m", "2h", "45s".
-    Disable scheduling with "disabled".
-    Returns None to indicate disabled.
-    """
+def _read_mcp_config(path: str) -> dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
 
-    if value is None:
-        return None
 
-    normalized = value.strip().lower()
-    if normalized in {"", "disabled"}:
-        return None
-
-    # Plain seconds
-    try:
-        return float(normalized)
-    except ValueError:
-        pass
-
-    match = re.fullmatch(r"(\d+(?:\.\d*)?)([smh])", normalized)
-    if not match:
-        raise ValueError(
-            "VERCADE_SCHEDULE_INTERVAL must be a number of seconds or end with s/m/h (e.g. '300', '15m', '2h', or 'disabled')"
-        )
-
-    amount = float(match.group(1))
-    unit = match.group(2)
-    if unit == "s":
-        return amount
-    if unit == "m":
-        return amount * 60.0
-    if unit == "h":
-        return amount * 60.0 * 60.0
-    # Should never reach here due to regex
-    raise ValueError("Invalid schedule interval unit")
+async def _run(config: Config, mcp_client: fastmcp.Client | None) -> None:
+    activity = discord.CustomActivity(name=config.activity) if config.activity else None
+    agent = Agent(
+        name=config.name,
+        identity=config.identity,
+        llm=config.llm,
+        temperature=config.temperature,
+        reasoning_effort=config.reasoning_effort,
+        mcp_client=mcp_client,
+    )
+    # TODO: Rename `proctor` to `discord`
+    proctor = DiscordClient(activity=activity, friend=agent)
+    Trigger(
+        proctor,
+        agent,
+        schedule_interval_seconds=config.schedule_interval_seconds,
+    )
+    # Run on this event loop instead of `Client.run`, which would start a
+    # nested one. Like `Client.run`, only set up the `discord` logger; the
+    # root logger belongs to `configure_logging`.
+    discord.utils.setup_logging(root=False)
+    async with proctor:
+        await proctor.start(config.discord_token)
 
 
 async def main():
-    dotenv.load_dotenv()
-    nest_asyncio.apply()
-
-    log_level = os.getenv("VERCADE_LOG_LEVEL")
-    if log_level:
-        logging.basicConfig(level=log_level.upper())
-    logging.getLogger("LiteLLM").setLevel(logging.WARNING)
-
-    if not os.getenv("VERCADE_NAME"):
-        raise ValueError("VERCADE_NAME environment variable must be set")
-    name = os.getenv("VERCADE_NAME")
+    config = Config.from_env()
+    configure_logging(config.log_level)
 
-    if not os.getenv("VERCADE_IDENTITY"):
-        raise ValueError("VERCADE_IDENTITY environment variable must be set")
-    identity = os.getenv("VERCADE_IDENTITY")
-
-    activity = os.getenv("VERCADE_ACTIVITY")
-    if activity:
-        activity = CustomActivity(name=activity)
-
-    if not os.getenv("DISCORD_TOKEN"):
-        raise ValueError("DISCORD_TOKEN environment variable must be set")
-    discord_token = os.getenv("DISCORD_TOKEN")
-
-    if not os.getenv("VERCADE_LLM"):
-        raise ValueError("VERCADE_LLM environment variable must be set")
-    llm = os.getenv("VERCADE_LLM")
-
-    temperature = os.getenv("VERCADE_LLM_TEMPERATURE")
-    temperature = float(temperature) if temperature else None
+    if not config.mcp_path:
+        await _run(config, mcp_client=None)
+        return
 
     # TODO(#22): Move mcp client initialization to own module
-    if os.getenv("MCP_PATH"):
-        config = json.loads(
-            await asyncio.to_thread(Path(os.getenv("MCP_PATH")).read_text)
-        )
-        # Resolve MCP server environment variables
-        for server in config["mcpServers"].values():
-            for key, value in server.get("env", {}).items():
-                if value.startswith("$"):
-                    server["env"][key] = os.getenv(value.lstrip("$"))
-        mcp_client = fastmcp.Client(config)
-    else:
-        mcp_client = None
-
-    schedule_interval_seconds = _parse_schedule_interval_seconds(
-        os.getenv("VERCADE_SCHEDULE_INTERVAL")
-    )
-
-    async with mcp_client:
-        agent = Agent(
-            name=name,
-            identity=identity,
-            llm=llm,
-            temperature=temperature,
-            reasoning_effort=os.getenv("VERCADE_LLM_REASONING_EFFORT"),
-            mcp_client=mcp_client,
-        )
-        # TODO: Rename `proctor` to `discord`
-        proctor = DiscordClient(activity=activity, friend=agent)
-        Trigger(proctor, agent, schedule_interval_seconds=schedule_interval_seconds)
-        proctor.run(discord_token)
+    # Read and parse off the event loop
+    mcp_config = await asyncio.to_thread(_read_mcp_config, config.mcp_path)
+    # Resolve MCP server environment variables
+    for server_name, server in mcp_config["mcpServers"].items():
+        for key, value in server.get("env", {}).items():
+            match = _ENV_REFERENCE_REGEX.match(value)
+            if not match:
+                continue
+            if match.group(1) not in os.environ:
+                raise ValueError(
+                    f"{match.group(1)} environment variable must be set for MCP server {server_name}"
+                )
+            server["env"][key] = os.environ[match.group(1)]
+    async with fastmcp.Client(mcp_config) as mcp_client:
+        await _run(config, mcp_client=mcp_client)
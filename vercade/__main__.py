@@ -3,4 +3,7 @@ import asyncio
 from vercade import main
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
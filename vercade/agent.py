@@ -1,14 +1,23 @@
 import asyncio
 import json
+import logging
 from datetime import datetime, timezone
-from functools import partial
 from typing import Any
 
 import fastmcp
-from litellm import ChatCompletionMessageToolCall, completion
+from litellm import ChatCompletionMessageToolCall, acompletion
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on MCP tool calls in flight per agent, so a response with many
+# tool calls does not trip the MCP servers' rate limits
+_MAX_CONCURRENT_TOOL_CALLS = 8
+
 
 # TODO: Make social media-specific
-_USER_MESSAGE_TEMPLATE = "{event} The current date and time is {date_time}. You may use any tools available to you, or do nothing at all. The user cannot see your responses directly, so you must use the tools if you would like to respond to the user. Take your time and think carefully before responding."
+def _build_user_message(event: str) -> str:
+    date_time = datetime.now(tz=timezone.utc).strftime("%Y-%m-%d %H:%M %Z")
+    return f"{event} The current date and time is {date_time}. You may use any tools available to you, or do nothing at all. The user cannot see your responses directly, so you must use the tools if you would like to respond to the user. Take your time and think carefully before responding."
 
 
 class Agent:
@@ -16,6 +25,19 @@ class Agent:
     Social media AI agent.
     """
 
+    __slots__ = (
+        "_llm",
+        "_mcp_client",
+        "_reasoning_effort",
+        "_system_message",
+        "_temperature",
+        "_tool_names",
+        "_tool_semaphore",
+        "_tools",
+        "_tools_lock",
+        "name",
+    )
+
     def __init__(
         self,
         name: str,
@@ -41,14 +63,26 @@ class Agent:
             raise ValueError("identity must be a non-empty string")
 
         self.name = name
-        self._identity = identity
+        # Built once and marked cacheable so providers with prompt caching
+        # (e.g. Anthropic) can reuse the identity prefix across completions;
+        # LiteLLM drops the flag for providers that do not support it
+        self._system_message = {
+            "role": "system",
+            "content": identity,
+            "cache_control": {"type": "ephemeral"},
+        }
         self._llm = llm
         self._temperature = temperature
         self._mcp_client = mcp_client
-        self._tools = None
+        self._tools: list[dict[str, Any]] | None = None
+        self._tool_names: frozenset[str] = frozenset()
+        self._tools_lock = asyncio.Lock()
+        self._tool_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_TOOL_CALLS)
         self._reasoning_effort = reasoning_effort
 
-    async def _mcp_tool(self, tool_name: str, input: str) -> list[dict[str, Any]]:
+    async def _mcp_tool(
+        self, tool_name: str, input: str | dict[str, Any]
+    ) -> list[dict[str, Any]]:
         if not self._mcp_client:
             raise ValueError("No MCP client provided")
         input = self._parse_input(input)
@@ -58,22 +92,35 @@ class Agent:
         # failure must reach the LLM as text instead of crashing the agent.
         except Exception as e:  # noqa: BLE001
             return f"Error calling tool {tool_name}: {e}"
-        output = json.dumps([block.model_dump() for block in result.content])
+        # Compact separators: the output is only read by the LLM, and every
+        # byte of whitespace costs prompt tokens
+        output = json.dumps(
+            [block.model_dump() for block in result.content], separators=(",", ":")
+        )
         if result.is_error:
             return f"Error calling tool {tool_name}: {output}"
         return output
 
-    def _parse_input(self, input: str) -> dict[str, Any]:
+    def _parse_input(self, input: str | dict[str, Any]) -> dict[str, Any]:
+        # Some providers hand back tool arguments that are already parsed
+        if isinstance(input, dict):
+            return input
         try:
             return json.loads(input)
         except json.JSONDecodeError:
             return {"content": input}
 
-    async def _get_tools(self) -> list[dict[str, Any]]:
+    async def _ensure_tools(self) -> None:
+        # MCP tools are listed once per agent and reused by every call; the
+        # lock stops concurrent first calls from listing them more than once.
         if self._tools is not None:
-            return self._tools
-        self._tools = (
-            [
+            return
+        async with self._tools_lock:
+            if self._tools is not None:
+                return
+            mcp_tools = await self._mcp_client.list_tools() if self._mcp_client else []
+            self._tool_names = frozenset(tool.name for tool in mcp_tools)
+            self._tools = [
                 {
                     "type": "function",
                     "function": {
@@ -82,18 +129,16 @@ class Agent:
                         "parameters": tool.inputSchema,
                     },
                 }
-                for tool in await self._mcp_client.list_tools()
+                for tool in mcp_tools
             ]
-            if self._mcp_client
-            else []
-        )
+
+    async def _get_tools(self) -> list[dict[str, Any]]:
+        await self._ensure_tools()
         return self._tools
 
     # TODO: Update return typehint
-    async def _run_tool(
-        self, tool_call: ChatCompletionMessageToolCall, functions: dict[str, Any]
-    ) -> None:
-        if tool_call.function.name not in functions:
+    async def _run_tool(self, tool_call: ChatCompletionMessageToolCall) -> None:
+        if tool_call.function.name not in self._tool_names:
             return {
                 "role": "tool",
                 "tool_call_id": tool_call.id,
@@ -101,16 +146,20 @@ class Agent:
                 "content": f"Unknown tool: {tool_call.function.name}",
             }
 
-        print(
-            f"Calling tool {tool_call.function.name} with {tool_call.function.arguments}"
+        logger.debug(
+            "Calling tool %s with %s",
+            tool_call.function.name,
+            tool_call.function.arguments,
         )
-        function = functions[tool_call.function.name]
-        if asyncio.iscoroutinefunction(function):
-            result = await function(tool_call.function.arguments)
-        else:
-            result = function(tool_call.function.arguments)
-        print(
-            f"Tool {tool_call.function.name} called with {tool_call.function.arguments} returned {result}"
+        async with self._tool_semaphore:
+            result = await self._mcp_tool(
+                tool_call.function.name, tool_call.function.arguments
+            )
+        logger.debug(
+            "Tool %s called with %s returned %s",
+            tool_call.function.name,
+            tool_call.function.arguments,
+            result,
         )
         return {
             "role": "tool",
@@ -127,61 +176,46 @@ class Agent:
             context: Conversation context.
         """
 
-        functions = {}
-        if self._mcp_client:
-            functions.update(
-                {
-                    tool.name: partial(self._mcp_tool, tool.name)
-                    for tool in await self._mcp_client.list_tools()
-                }
-            )
+        tools = await self._get_tools()
 
         # Conversation with LLM
         chat_history = [
-            {
-                "role": "system",
-                "content": self._identity,
-            },
+            self._system_message,
             {
                 "role": "user",
-                "content": _USER_MESSAGE_TEMPLATE.format(
-                    event=event,
-                    date_time=datetime.now(tz=timezone.utc).strftime(
-                        "%Y-%m-%d %H:%M:%S %Z"
-                    ),
-                ),
+                "content": _build_user_message(event),
+                # Every completion in the tool loop re-sends this prefix
+                "cache_control": {"type": "ephemeral"},
             },
         ]
         ran_tools = False
         while True:
             response = (
                 (
-                    await asyncio.to_thread(
-                        completion,
+                    await acompletion(
                         model=self._llm,
                         temperature=self._temperature,
                         messages=chat_history,
-                        # TODO: Move tool initialization to constructor
-                        tools=await self._get_tools(),
+                        tools=tools,
                         reasoning_effort=self._reasoning_effort,
                     )
                 )
                 .choices[0]
                 .message
             )
-            print(f"Thought: {response.content}")
+            logger.debug("Thought: %s", response.content)
             if not response.tool_calls:
                 if not ran_tools:
                     raise ValueError(f"No tools were called\n\n{response.content}")
                 break
-            tool_results = await asyncio.gather(
-                *[
-                    self._run_tool(tool_call, functions)
+            chat_history.append(response)
+            async with asyncio.TaskGroup() as task_group:
+                tool_tasks = [
+                    task_group.create_task(self._run_tool(tool_call))
                     for tool_call in response.tool_calls
                 ]
-            )
-            chat_history += [
-                response,
-                *tool_results,
-            ]
+                # Results are matched to calls by `tool_call_id`, so append
+                # them as they finish rather than waiting for the slowest tool
+                for tool_result in asyncio.as_completed(tool_tasks):
+                    chat_history.append(await tool_result)
             ran_tools = True
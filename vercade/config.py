@@ -0,0 +1,147 @@
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import re
+from dataclasses import dataclass
+
+import dotenv
+
+_REQUIRED_ENV_VARS = (
+    "VERCADE_NAME",
+    "VERCADE_IDENTITY",
+    "DISCORD_TOKEN",
+    "VERCADE_LLM",
+)
+
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+_SCHEDULE_INTERVAL_DISABLED = frozenset({"", "disabled"})
+_SCHEDULE_INTERVAL_REGEX = re.compile(r"(\d+(?:\.\d+)?)([smh])")
+_SCHEDULE_INTERVAL_UNIT_SECONDS = {"s": 1.0, "m": 60.0, "h": 60.0 * 60.0}
+
+_dotenv_loaded = False
+_logging_configured = False
+
+
+def _load_dotenv() -> None:
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    dotenv.load_dotenv()
+    _dotenv_loaded = True
+
+
+def configure_logging(level: str | None) -> None:
+    """
+    Configure logging once per process.
+
+    Args:
+        level: Root log level (e.g. "debug", "INFO"), or None to keep the default.
+    """
+
+    global _logging_configured
+    if _logging_configured:
+        return
+    if level:
+        # Write records from a background thread so that slow writes to stderr
+        # do not block the event loop
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+        listener.start()
+        atexit.register(listener.stop)
+        logging.basicConfig(
+            level=level.upper(), handlers=[logging.handlers.QueueHandler(log_queue)]
+        )
+    logging.getLogger("LiteLLM").setLevel(logging.WARNING)
+    _logging_configured = True
+
+
+def _parse_schedule_interval_seconds(value: str | None) -> float | None:
+    """
+    Parse VERCADE_SCHEDULE_INTERVAL into seconds.
+
+    Supports raw seconds (e.g. "300"), or suffixed values like "15m", "2h", "45s".
+    Disable scheduling with "disabled".
+    Returns None to indicate disabled.
+    """
+
+    if value is None:
+        return None
+
+    # Plain seconds
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    normalized = value.strip().lower()
+    if normalized in _SCHEDULE_INTERVAL_DISABLED:
+        return None
+
+    match = _SCHEDULE_INTERVAL_REGEX.fullmatch(normalized)
+    if not match:
+        raise ValueError(
+            "VERCADE_SCHEDULE_INTERVAL must be a number of seconds or end with s/m/h (e.g. '300', '15m', '2h', or 'disabled')"
+        )
+
+    return float(match.group(1)) * _SCHEDULE_INTERVAL_UNIT_SECONDS[match.group(2)]
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Bot configuration, read once from the environment.
+    """
+
+    name: str
+    identity: str
+    discord_token: str
+    llm: str
+    temperature: float | None = None
+    reasoning_effort: str | None = None
+    activity: str | None = None
+    log_level: str | None = None
+    mcp_path: str | None = None
+    schedule_interval_seconds: float | None = None
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """
+        Load `.env` (once per process) and read the configuration from the environment.
+
+        Raises:
+            ValueError: If a required environment variable is missing or a value is invalid.
+        """
+
+        _load_dotenv()
+        env = os.environ
+
+        missing = [key for key in _REQUIRED_ENV_VARS if not env.get(key)]
+        if missing:
+            raise ValueError(
+                f"{', '.join(missing)} environment variable{'s' if len(missing) > 1 else ''} must be set"
+            )
+
+        log_level = env.get("VERCADE_LOG_LEVEL", "").upper() or None
+        if log_level and log_level not in _LOG_LEVELS:
+            raise ValueError(
+                f"VERCADE_LOG_LEVEL must be one of: {', '.join(sorted(_LOG_LEVELS))}"
+            )
+
+        temperature = env.get("VERCADE_LLM_TEMPERATURE")
+        return cls(
+            name=env["VERCADE_NAME"],
+            identity=env["VERCADE_IDENTITY"],
+            discord_token=env["DISCORD_TOKEN"],
+            llm=env["VERCADE_LLM"],
+            temperature=float(temperature) if temperature else None,
+            reasoning_effort=env.get("VERCADE_LLM_REASONING_EFFORT") or None,
+            activity=env.get("VERCADE_ACTIVITY") or None,
+            log_level=log_level,
+            mcp_path=env.get("MCP_PATH") or None,
+            schedule_interval_seconds=_parse_schedule_interval_seconds(
+                env.get("VERCADE_SCHEDULE_INTERVAL")
+            ),
+        )
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import re
 
 import discord
@@ -14,6 +15,20 @@ from vercade.social_media import (
     SocialMedia,
 )
 
+logger = logging.getLogger(__name__)
+
+_MENTION_REGEX = re.compile(r"@(\w+)")
+
+# Simulated typing speed before sending a message, capped so long messages
+# are not held back for more than a few seconds
+_TYPING_CHARACTERS_PER_SECOND = 20.0
+_MAX_TYPING_SECONDS = 5.0
+_MIN_TYPING_SECONDS = 0.05
+
+
+def _typing_delay(length: int) -> float:
+    return min(length / _TYPING_CHARACTERS_PER_SECOND, _MAX_TYPING_SECONDS)
+
 
 class DiscordClient(discord.Client, SocialMedia):
     def __init__(
@@ -39,23 +54,24 @@ class DiscordClient(discord.Client, SocialMedia):
     async def _discord_message_to_message(self, message: discord.Message) -> Message:
         content = message.system_content
 
-        # Replace Discord mentions with @username mentions
-        for mention in message.mentions:
-            content = content.replace(mention.mention, f"@{mention.name}")
-
-        reactions = []
-        for reaction in message.reactions:
-            users = []
-            async for user in reaction.users():
-                users.append(user.name)
-            reactions.append(
-                Reaction(
-                    emoji=self._emoji_name(reaction.emoji),
-                    users=users,
-                )
-            )
+        # Replace Discord mentions with @username mentions in a single pass
+        if message.mentions:
+            names = {mention.mention: mention.name for mention in message.mentions}
+            pattern = re.compile("|".join(map(re.escape, names)))
+            content = pattern.sub(lambda match: f"@{names[match.group(0)]}", content)
+
+        # Each reaction's users are a separate paginated request, so fetch
+        # them concurrently
+        reaction_users = await asyncio.gather(
+            *[self._reaction_users(reaction) for reaction in message.reactions]
+        )
+        reactions = [
+            Reaction(emoji=self._emoji_name(reaction.emoji), users=users)
+            for reaction, users in zip(message.reactions, reaction_users, strict=True)
+        ]
 
         return Message(
+            id=message.id,
             content=content,
             author=message.author.name,
             created_at=message.created_at,
@@ -63,6 +79,9 @@ class DiscordClient(discord.Client, SocialMedia):
             reactions=reactions,
         )
 
+    async def _reaction_users(self, reaction: discord.Reaction) -> list[str]:
+        return [user.name async for user in reaction.users()]
+
     def _emoji_name(self, emoji: discord.PartialEmoji | discord.Emoji | str) -> str:
         if isinstance(emoji, discord.PartialEmoji | discord.Emoji):
             return emoji.name
@@ -86,18 +105,22 @@ class DiscordClient(discord.Client, SocialMedia):
         self, message: Message, channel: discord.TextChannel
     ) -> str:
         content = message.content
+        if "@" not in content:
+            return content
 
-        # Replace @username mentions with Discord mentions
-        all_users = {user.name: user for user in channel.guild.members}
-        mentions = re.findall(r"@(\w+)", content)
-        for username in mentions:
-            user = all_users.get(username)
-            if not user:
-                print(f"User {username} not found")
+        # Replace @username mentions with Discord mentions. The index is built
+        # per call: without the members intent no member events fire, so a
+        # cached one could not be kept in sync.
+        all_users = {member.name: member for member in channel.guild.members}
 
-            content = content.replace(f"@{username}", f"<@{user.id}>")
+        def replace_mention(match: re.Match[str]) -> str:
+            user = all_users.get(match.group(1))
+            if not user:
+                logger.warning("User %s not found", match.group(1))
+                return match.group(0)
+            return f"<@{user.id}>"
 
-        return content
+        return _MENTION_REGEX.sub(replace_mention, content)
 
     async def on_message(self, message: discord.Message) -> None:
         if self.on_message_callback:
@@ -115,12 +138,15 @@ class DiscordClient(discord.Client, SocialMedia):
     async def _get_guild_and_channel(
         self, context: MessageContext
     ) -> tuple[discord.Guild, discord.TextChannel]:
-        guild = discord.utils.get(self.guilds, id=context.server.id)
+        # discord.py already indexes its guild and channel caches by ID
+        guild = self.get_guild(context.server.id)
         if not guild:
             raise ValueError(f"Guild {context.server.id} not found")
-        channel = discord.utils.get(guild.text_channels, name=context.channel.name)
+        channel = guild.get_channel(context.channel.id)
         if not channel:
             raise ValueError(f"Channel {context.channel.id} not found")
+        if not isinstance(channel, discord.TextChannel):
+            raise TypeError(f"Channel {context.channel.id} is not a text channel")
         return guild, channel
 
     async def _get_message(
@@ -130,6 +156,8 @@ class DiscordClient(discord.Client, SocialMedia):
         message: Message,
         fetch_limit: int = 100,
     ) -> discord.Message:
+        if message.id is not None:
+            return await channel.fetch_message(message.id)
         async for msg in channel.history(limit=fetch_limit):
             if msg.content == message.content:
                 return msg
@@ -138,14 +166,14 @@ class DiscordClient(discord.Client, SocialMedia):
         self, context: MessageContext, limit: int = 100
     ) -> list[Message]:
         _, channel = await self._get_guild_and_channel(context)
-        return list(
-            reversed(
-                [
-                    await self._discord_message_to_message(message)
-                    async for message in channel.history(limit=limit)
-                ]
-            )
-        )
+        # `oldest_first=True` would return the channel's first messages rather
+        # than the latest ones, so fetch newest first and reverse in place
+        messages = [
+            await self._discord_message_to_message(message)
+            async for message in channel.history(limit=limit)
+        ]
+        messages.reverse()
+        return messages
 
     # TODO(#17): Remove unused `send`
     async def send(self, context: MessageContext, message: Message) -> None:
@@ -153,8 +181,10 @@ class DiscordClient(discord.Client, SocialMedia):
             return
 
         _, channel = await self._get_guild_and_channel(context)
-        async with channel.typing():
-            await asyncio.sleep(len(message.content) / 20.0)
+        delay = _typing_delay(len(message.content))
+        if delay > _MIN_TYPING_SECONDS:
+            async with channel.typing():
+                await asyncio.sleep(delay)
         await channel.send(self._format_message_for_discord(message, channel))
 
     # TODO(#17): Remove unused `react`
@@ -40,6 +40,16 @@ class MessageContext:
 class Message:
     _MENTION_REGEX = re.compile(r"@(\w+)")
 
+    __slots__ = (
+        "_author",
+        "_content",
+        "_created_at",
+        "_embeds",
+        "_id",
+        "_mentions",
+        "_reactions",
+    )
+
     def __init__(
         self,
         content: str,
@@ -47,7 +57,9 @@ class Message:
         created_at: datetime.datetime,
         embeds: list[Embed] | None = None,
         reactions: list[Reaction] | None = None,
+        id: int | None = None,
     ) -> None:
+        self._id = id
         self._content = content
         self._author = author
         self._created_at = created_at
@@ -55,6 +67,10 @@ class Message:
         self._embeds = embeds if embeds is not None else []
         self._reactions = reactions if reactions is not None else []
 
+    @property
+    def id(self) -> int | None:
+        return self._id
+
     @property
     def content(self) -> str:
         return self._content
@@ -83,11 +83,11 @@ class Trigger:
         task = self._response_tasks.get(context.server.id, {}).get(context.channel.id)
         if task and not task.done():
             task.cancel()
-            # Ensure the task is actually cancelled before proceeding to avoid duplicate sends
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+            # Ensure the task is actually cancelled before proceeding to avoid
+            # duplicate sends. Unlike `await task`, `asyncio.wait` neither
+            # re-raises whatever the cancelled task ended with nor swallows a
+            # cancellation of this coroutine.
+            await asyncio.wait([task])
             self._remove_response_task(context)
 
         task = asyncio.create_task(